@@ -28,27 +28,26 @@
 
 """Module containing the base class for a database engine."""
 
-from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Sequence, Type
 
 from pygasus.engine.generic.columns.base import BaseColumn
 from pygasus.engine.generic.table import GenericTable
 from pygasus.schema.transaction import Transaction
 
-class BaseEngine(metaclass=ABCMeta):
+class BaseEngine:
 
     """
     Base class for a database engine.
 
     Adding a database engine can be done by inheriting from `BaseEngine`
-    and setting the new engine in the database.
+    and setting the new engine in the database.  Methods raising
+    `NotImplementedError` should be overridden in sub-classes.
 
     """
 
     def __init__(self, database):
         self.database = database
 
-    @abstractmethod
     def init(self, *args, **kwargs):
         """
         Initialize the database engine.
@@ -58,16 +57,16 @@ class BaseEngine(metaclass=ABCMeta):
         Optional and keyword arguments are supported.
 
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def close(self):
         """Close the database."""
+        raise NotImplementedError
 
-    @abstractmethod
     def destroy(self):
         """Destroy the database."""
+        raise NotImplementedError
 
-    @abstractmethod
     def create_migration_table(self):
         """
         Create the migration table, if it doesn't exist.
@@ -77,8 +76,8 @@ class BaseEngine(metaclass=ABCMeta):
         table already exists.
 
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def create_table_for(self, table: GenericTable):
         """
         Create a database table for this Generic table.
@@ -91,11 +90,11 @@ class BaseEngine(metaclass=ABCMeta):
             table (GenericTable): the generic table.
 
         """
+        raise NotImplementedError
 
     def run_after_table_creation(self):
         """When all the tables have been created."""
 
-    @abstractmethod
     def get_saved_schema_for(self, table: GenericTable):
         """
         Return the saved schema for this table, if any.
@@ -108,8 +107,24 @@ class BaseEngine(metaclass=ABCMeta):
             table (GenericTable): the generic table.
 
         """
+        raise NotImplementedError
+
+    def get_saved_schemas(self, models: Sequence[type]) -> Dict[type, Any]:
+        """
+        Return the saved schemas for these models, if any.
+
+        By default, schemas are read one model at a time.  Engines able
+        to read all saved schemas at once should override this method.
+
+        Args:
+            models (sequence): the model classes.
+
+        Returns:
+            schemas (dict): the saved schema (or None) for each model.
+
+        """
+        return {model: self.get_saved_schema_for(model) for model in models}
 
-    @abstractmethod
     def get_row(self, table: GenericTable,
             columns: Dict[BaseColumn, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -129,8 +144,8 @@ class BaseEngine(metaclass=ABCMeta):
             row (dict or None): the row columns as a dict.
 
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def select_rows(self, query, filters):
         """
         Return a query object filtered according to the specified arguments.
@@ -149,11 +164,12 @@ class BaseEngine(metaclass=ABCMeta):
             the database, effectively querying the results.
 
         Returns:
-            rows (list): The list of rows matching the specified query.
+            rows (iterable): The rows matching the specified query,
+                    as dictionaries (possibly none).
 
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def insert_row(self, table: GenericTable,
             columns: Dict[BaseColumn, Any]) -> Dict[str, Any]:
         """
@@ -166,25 +182,42 @@ class BaseEngine(metaclass=ABCMeta):
                     a default value).
 
         """
+        raise NotImplementedError
+
+    def insert_rows(self, table: GenericTable,
+            rows: Sequence[Dict[BaseColumn, Any]]) -> List[Dict[str, Any]]:
+        """
+        Insert several rows in the database.
+
+        By default, rows are inserted one at a time.  Engines able to
+        insert several rows at once should override this method.
+
+        Args:
+            table (GenericTable): the generic table.
+            rows (sequence): the dictionaries of columns, one per row.
+
+        Returns:
+            data (list): the dictionary of inserted values for each row.
+
+        """
+        return [self.insert_row(table, columns) for columns in rows]
 
-    @abstractmethod
     def update_row(self, table: GenericTable, primary_keys: Dict[str, Any],
-            column: BaseColumn, value: Any):
+            columns: Dict[BaseColumn, Any]):
         """
-        If possible, update the specified row's field.
+        If possible, update the specified row's fields.
 
         Args:
             table (GenericTable): the generic table.
             primary_keys (dict): the dictionary of primary keys.
-            column (BaseColumn): the column to update.
-            value (Any): the column's new value.
+            columns (dict): the columns to update, with their new values.
 
-        This value is supposed to have been filtered and allowed by the
+        These values are supposed to have been filtered and allowed by the
         model layer.
 
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def delete_row(self, table: GenericTable, primary_keys: Dict[str, Any]):
         """
         Delete the specified row from the database.
@@ -194,8 +227,25 @@ class BaseEngine(metaclass=ABCMeta):
             primary_keys (dict): the dictionary of primary keys.
 
         """
+        raise NotImplementedError
+
+    def delete_rows(self, table: GenericTable,
+            primary_keys: Sequence[Dict[str, Any]]):
+        """
+        Delete several rows from the database.
+
+        By default, rows are deleted one at a time.  Engines able to
+        delete several rows at once should override this method.
+
+        Args:
+            table (GenericTable): the generic table.
+            primary_keys (sequence of dict): the dictionaries of
+                    primary keys, one per row.
+
+        """
+        for primary in primary_keys:
+            self.delete_row(table, primary)
 
-    @abstractmethod
     def begin_transaction(self, transaction: Transaction):
         """
         Begin a transaction.
@@ -204,8 +254,8 @@ class BaseEngine(metaclass=ABCMeta):
             transaction: the transacrion to begin.
 
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def commit_transaction(self, transaction: Transaction):
         """
         Commit a transaction.
@@ -214,8 +264,8 @@ class BaseEngine(metaclass=ABCMeta):
             transaction: the transacrion to commit.
 
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def rollback_transaction(self, transaction: Transaction):
         """
         Rollback a transaction.
@@ -224,3 +274,4 @@ class BaseEngine(metaclass=ABCMeta):
             transaction: the transacrion to rollback.
 
         """
+        raise NotImplementedError
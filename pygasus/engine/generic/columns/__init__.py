@@ -28,6 +28,8 @@
 
 """Package containing generic columns."""
 
+import datetime
+
 from pygasus.engine.generic.columns.blob import BlobColumn
 from pygasus.engine.generic.columns.date import DateColumn
 from pygasus.engine.generic.columns.integer import IntegerColumn
@@ -35,3 +37,12 @@ from pygasus.engine.generic.columns.one2one import OneToOneColumn
 from pygasus.engine.generic.columns.real import RealColumn
 from pygasus.engine.generic.columns.text import TextColumn
 from pygasus.engine.generic.columns.timestamp import TimestampColumn
+
+COL_TYPES = {
+        bytes: BlobColumn,
+        datetime.date: DateColumn,
+        datetime.datetime: TimestampColumn,
+        int: IntegerColumn,
+        float: RealColumn,
+        str: TextColumn,
+}
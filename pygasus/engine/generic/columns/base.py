@@ -28,6 +28,8 @@
 
 """Module containing the BaseColumn class."""
 
+import sys
+
 class BaseColumn:
 
     """
@@ -38,9 +40,12 @@ class BaseColumn:
 
     """
 
+    __slots__ = ("table", "name", "primary_key", "default", "has_default",
+            "set_by_database")
+
     def __init__(self, field, table):
         self.table = table
-        self.name = field.name
+        self.name = sys.intern(field.name)
         self.primary_key = field.primary_key
         self.default = field.default
         self.has_default = field.has_default
@@ -51,5 +56,15 @@ class BaseColumn:
         return f"<Column {self.name!r} of type {type(self).__name__}>"
 
     def retrieve_additional_columns(self, fields):
-        """Return additional columns for this column type."""
-        return {}
+        """
+        Return an additional column and its value for this column type.
+
+        Args:
+            fields (dict): the dictionary of field and data.
+
+        Returns:
+            column (tuple or None): a tuple containing the column and
+                    its value, or None if there is nothing to add.
+
+        """
+        return None
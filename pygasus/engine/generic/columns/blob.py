@@ -33,3 +33,5 @@ from pygasus.engine.generic.columns.base import BaseColumn
 class BlobColumn(BaseColumn):
 
     """Column to contain binary data."""
+
+    __slots__ = ()
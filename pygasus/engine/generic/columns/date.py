@@ -33,3 +33,5 @@ from pygasus.engine.generic.columns.base import BaseColumn
 class DateColumn(BaseColumn):
 
     """Column to contain a datetime.date."""
+
+    __slots__ = ()
@@ -33,3 +33,5 @@ from pygasus.engine.generic.columns.base import BaseColumn
 class IntegerColumn(BaseColumn):
 
     """Column to contain an integer."""
+
+    __slots__ = ()
@@ -28,30 +28,35 @@
 
 """Module containing the OneToOne related column."""
 
+import sys
+
 from pygasus.engine.generic.columns.base import BaseColumn
 
+_NOT_SET = object()
+
 class OneToOneColumn(BaseColumn):
 
     """Column to contain a reference to a model."""
 
+    __slots__ = ("from_model", "to_model", "from_field", "to_field",
+            "primary", "_from_name", "_primary_name")
+
     def __init__(self, table, from_model, to_model, from_field, to_field, primary):
         super().__init__(from_field, table)
-        model_name = to_model._alt_name or to_model.__name__.lower()
-        self.name = f"{model_name}_{primary.name}"
+        self.name = sys.intern(f"{to_model._canonical_name}_{primary.name}")
         self.from_model = from_model
         self.to_model = to_model
         self.from_field = from_field
         self.to_field = to_field
         self.primary = primary
+        self._from_name = from_field.name
+        self._primary_name = primary.name
         to_field.column = self
 
     def retrieve_additional_columns(self, fields):
-        """Return additional columns for this column type."""
-        try:
-            model = fields[self.from_field.name]
-        except KeyError:
-            return {}
-
-        return {
-                self: getattr(model, self.primary.name, None),
-        }
+        """Return the additional column and its value, if any."""
+        model = fields.get(self._from_name, _NOT_SET)
+        if model is _NOT_SET:
+            return None
+
+        return (self, getattr(model, self._primary_name, None))
@@ -33,3 +33,5 @@ from pygasus.engine.generic.columns.base import BaseColumn
 class RealColumn(BaseColumn):
 
     """Column to contain a float."""
+
+    __slots__ = ()
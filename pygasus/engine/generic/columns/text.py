@@ -33,3 +33,5 @@ from pygasus.engine.generic.columns.base import BaseColumn
 class TextColumn(BaseColumn):
 
     """Column to contain text."""
+
+    __slots__ = ()
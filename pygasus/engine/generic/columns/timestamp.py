@@ -33,3 +33,5 @@ from pygasus.engine.generic.columns.base import BaseColumn
 class TimestampColumn(BaseColumn):
 
     """Column to contain a datetime.datetime."""
+
+    __slots__ = ()
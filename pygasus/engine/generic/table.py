@@ -28,25 +28,13 @@
 
 """Module containing the Table class."""
 
-from collections import OrderedDict
-import datetime
+from functools import partial
 from typing import Any, Dict, Type
 
-from pygasus.engine.generic.columns import (
-        BlobColumn, DateColumn, IntegerColumn, OneToOneColumn,
-        RealColumn, TimestampColumn, TextColumn)
+from pygasus.engine.generic.columns import OneToOneColumn
 from pygasus.engine.generic.columns.base import BaseColumn
 from pygasus.schema.model import Model
 
-COL_TYPES = {
-        bytes: BlobColumn,
-        datetime.date: DateColumn,
-        datetime.datetime: TimestampColumn,
-        int: IntegerColumn,
-        float: RealColumn,
-        str: TextColumn,
-}
-
 class GenericTable:
 
     """
@@ -59,11 +47,19 @@ class GenericTable:
 
     """
 
+    __slots__ = ("model", "name", "columns", "_plan", "_handlers",
+            "_mirrors", "_resolved")
+
     def __init__(self, model: Type[Model]):
         self.model = model
-        self.name = model._alt_name or model.__name__.lower()
-        self.columns = OrderedDict()
-        self.values = {}
+        self.name = model._canonical_name
+        self.columns = {}
+
+        # Plan used by `prepare_columns`, filled when columns are added.
+        self._plan = {}
+        self._handlers = []
+        self._mirrors = None
+        self._resolved = {}
 
     def generate_column_from_field(self, field, database):
         """
@@ -71,18 +67,17 @@ class GenericTable:
 
         Args:
             field (Field): the model field.
+            database (Database): the database.
 
         """
         columns = []
-        if issubclass(field.field_type, Model):
+        if field.is_relation:
             # Try to find the counterpart.
             opposed = field.field_type
 
-            # Browse the opposite model for a link to the current model.
-            for opposite_field in opposed._schema.fields.values():
-                if opposite_field.field_type is self.model:
-                    break
-            else:
+            # Look in the opposite model for a link to the current model.
+            opposite_fields = opposed._schema.fields_by_type.get(self.model)
+            if not opposite_fields:
                 raise ValueError(
                         f"model {field.model.__name__}.{field.name}: "
                         f"cannot find an opposed field in model "
@@ -91,18 +86,25 @@ class GenericTable:
                 )
 
             # Now determines the type of relationship.
-            back = opposite_field
+            back = opposite_fields[0]
             if back.field_type is self.model and back.has_default: # One-to-one
-                for pk in field.field_type._schema.primary_keys:
-                    columns.append(OneToOneColumn(self, self.model,
-                            field.field_type, field, back, pk))
+                factory = partial(OneToOneColumn, self, self.model,
+                        opposed, field, back)
+                columns = [factory(pk)
+                        for pk in opposed._schema._primary_keys_tuple]
         else:
-            col_type = COL_TYPES.get(field.field_type, BlobColumn)
-            columns.append(col_type(field, self))
+            column = field.column_type(field, self)
+            columns.append(column)
+            self._plan[field.name] = column
 
         for column in columns:
             self.columns[column.name] = column
 
+            # Only keep the columns overriding the hook.
+            retrieve = type(column).retrieve_additional_columns
+            if retrieve is not BaseColumn.retrieve_additional_columns:
+                self._handlers.append(column.retrieve_additional_columns)
+
     def prepare_columns(self,
             fields: Dict['pygasus.schema.field.Field', Any],
             search_outside: bool = False) -> Dict[BaseColumn, Any]:
@@ -121,33 +123,106 @@ class GenericTable:
             columsn (dict): the columns to store.
 
         """
-        columns = {}
-        for field, value in tuple(fields.items()):
-            key = field.name
-            column = self.columns.get(key)
-            if column is None:
-                continue
+        # The same fields are always resolved to the same columns.
+        key = (tuple([field.name for field in fields]), search_outside)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = self._resolve(*key)
+            self._resolved[key] = resolved
+
+        direct, mirrored = resolved
+        values = tuple(fields.values())
+        columns = {column: values[i] for i, column in direct}
+
+        # Ask the columns if they want to do something.
+        for handler in self._handlers:
+            additional = handler(fields)
+            if additional is not None:
+                column, value = additional
+                columns[column] = value
+
+        for i, column, primary in mirrored:
+            value = values[i]
+            if primary is None:
+                columns[column] = value
+            else:
+                columns[column] = getattr(value, primary, None)
+
+        return columns
+
+    def _resolve(self, names, search_outside):
+        """
+        Resolve field names into columns.
+
+        Args:
+            names (tuple): the field names, in order.
+            search_outside (bool): if set to True, search fields in
+                    other models.
 
-            columns[column] = value
-            fields.pop(key)
+        Returns:
+            resolved (tuple): a tuple of two tuples: the `(index, column)`
+                    of fields stored in this table, and the
+                    `(index, column, primary)` of fields stored in
+                    other tables (see `_get_mirrors`).
 
-        # Ask the remaining columns if they want to do something.
-        for column in self.columns.values():
-            columns.update(column.retrieve_additional_columns(fields))
+        """
+        direct = []
+        mirrored = []
+        for i, name in enumerate(names):
+            column = self._plan.get(name)
+            if column is not None:
+                direct.append((i, column))
+            elif search_outside:
+                for column, primary in self._get_mirrors().get(name, ()):
+                    mirrored.append((i, column, primary))
+
+        return tuple(direct), tuple(mirrored)
+
+    def _get_mirrors(self):
+        """
+        Return the columns of mirrored fields in other tables.
 
-        if search_outside and fields:
-            for field, value in fields.items():
-                if field.mirror:
-                    columns.update(field.mirror.model._generic.prepare_columns({field.mirror: value}, search_outside=False))
+        The returned dictionary contains, as keys, the field names
+        of this table, and as values, tuples of `(column, primary)`
+        where `column` is the mirror's column in the other table,
+        and `primary` the primary key name to read from the value
+        (or None if the value is stored as is).  It is built on
+        first use, since other tables might not exist before.
 
+        """
+        if self._mirrors is not None:
+            return self._mirrors
 
-        return columns
+        mirrors = {}
+        for field in self.model._schema._fields_tuple:
+            mirror = field.mirror
+            if mirror is None:
+                continue
+
+            target = mirror.model._generic
+            steps = []
+            column = target._plan.get(mirror.name)
+            if column is not None:
+                steps.append((column, None))
+
+            for column in target.columns.values():
+                if (isinstance(column, OneToOneColumn)
+                        and column.from_field.name == mirror.name):
+                    steps.append((column, column.primary.name))
+
+            mirrors[field.name] = tuple(steps)
+
+        self._mirrors = mirrors
+        return mirrors
 
     @classmethod
     def create_from_model(cls, model, database):
         """
         Create a generic table from a model class.
 
+        Tables are cached in the database, so that binding the same
+        models again doesn't rebuild them.
+
         Args:
             model (subclass of Model): the model class.
             database (Database): the database.
@@ -156,9 +231,14 @@ class GenericTable:
             generic (GenericTable): the new generic table.
 
         """
+        generic = database._generic_tables.get(model)
+        if generic is not None:
+            return generic
+
         generic = cls(model)
-        for field in model._schema.fields.values():
+        for field in model._schema._fields_tuple:
             generic.generate_column_from_field(field, database)
 
         model._table = generic
+        database._generic_tables[model] = generic
         return generic
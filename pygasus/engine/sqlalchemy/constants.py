@@ -28,17 +28,28 @@
 
 """SQLAlchemy constants."""
 
+from types import MappingProxyType
+
 from sqlalchemy import Date, DateTime, Float, Integer, LargeBinary, Text
 
 from pygasus.engine.generic.columns import (
-        BlobColumn, DateColumn, IntegerColumn,
+        BlobColumn, DateColumn, IntegerColumn, OneToOneColumn,
         RealColumn, TextColumn, TimestampColumn)
 
-SQL_TYPES = {
+SQL_TYPES = MappingProxyType({
         BlobColumn: LargeBinary,
         DateColumn: Date,
         IntegerColumn: Integer,
         RealColumn: Float,
         TextColumn: Text,
         TimestampColumn: DateTime,
-}
+})
+
+# Columns whose values are returned by sqlite3 without conversion.
+RAW_TYPES = frozenset((
+        BlobColumn,
+        IntegerColumn,
+        OneToOneColumn,
+        RealColumn,
+        TextColumn,
+))
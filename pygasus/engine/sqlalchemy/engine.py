@@ -28,11 +28,13 @@
 
 """Module containing the SQLAlchemy-compatible database engine."""
 
+from collections import OrderedDict
+from contextlib import contextmanager
 import datetime
-from itertools import count
+from functools import reduce
 import pathlib
-import pickle
-from typing import Any, Dict, Optional, Type, Union
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
 
 from pygasus.engine.base import BaseEngine
 from pygasus.engine.generic.columns import IntegerColumn, OneToOneColumn
@@ -47,11 +49,11 @@ try:
     from sqlalchemy import (
             create_engine, event, Column, ForeignKey, MetaData, Table
     )
-    from sqlalchemy.sql import select, text
+    from sqlalchemy.sql import bindparam, select, text
 except ModuleNotFoundError:
     raise ModuleNotFoundError("SQLAlchemy is not installed")
 
-from pygasus.engine.sqlalchemy.constants import SQL_TYPES
+from pygasus.engine.sqlalchemy.constants import RAW_TYPES, SQL_TYPES
 
 class SQLAlchemyEngine(BaseEngine):
 
@@ -64,17 +66,38 @@ class SQLAlchemyEngine(BaseEngine):
 
     """
 
+    # Number of rows to fetch at once when selecting several rows.
+    fetch_size = 1000
+
+    # Number of select statements to keep, see `select_rows`.
+    select_cache_size = 256
+
+    # Number of get, update and delete statements to keep.
+    statement_cache_size = 512
+
+    # SQLite pragmas set on each connection, see `init`.  They don't
+    # change durability: the journal mode and synchronous setting
+    # are left to SQLite, unless specified.
+    pragmas = {
+            "temp_store": "MEMORY",
+            "cache_size": -64000,
+            "mmap_size": 268435456,
+            "busy_timeout": 5000,
+    }
+
     def __init__(self, database):
         super().__init__(database)
         self.file_name = None
         self.memory = False
         self.savepoints = {}
-        self.savepoint_id = count(1)
+        self.savepoint_statements = {}
         self.transaction = None
+        self.bulk_transaction = None
+        self.connection = None
         self.printout = False
 
     def init(self, file_name: Union[str, pathlib.Path, None] = None,
-            memory: bool = False):
+            memory: bool = False, pragmas: Optional[Dict[str, Any]] = None):
         """
         Initialize the database engine.
 
@@ -86,8 +109,19 @@ class SQLAlchemyEngine(BaseEngine):
                     the `memory` argument to `True`.
             memory (bool): whether to store this database in memory or
                     not?  If `True`, the file name is ignored.
+            pragmas (dict): the SQLite pragmas to change, with their
+                    values, overriding the engine's `pragmas`.  Set
+                    a pragma to `None` to keep SQLite's default.
+                    The journal mode is ignored in memory.  For
+                    instance, `{"journal_mode": "WAL", "synchronous":
+                    "NORMAL"}` uses a write-ahead log, which is faster
+                    but less durable.
 
         """
+        pragmas = {**self.pragmas, **(pragmas or {})}
+        if memory:
+            pragmas.pop("journal_mode", None)
+
         self.file_name = file_name if not memory else None
         self.memory = memory
 
@@ -95,27 +129,61 @@ class SQLAlchemyEngine(BaseEngine):
         if memory:
             sql_file_name = ":memory:"
         else:
-            if isinstance(file_name, str):
-                file_name = pathlib.Path(file_name)
-
-            assert isinstance(file_name, pathlib.Path)
-            if file_name.absolute():
-                sql_file_name = str(file_name)
-            else:
-                sql_file_name = str(file_name.resolve())
+            file_name = pathlib.Path(file_name)
+            if not file_name.is_absolute():
+                file_name = file_name.resolve()
+            sql_file_name = str(file_name)
             self.file_name = file_name
-        self.engine = create_engine(f"sqlite:///{sql_file_name}")
+        self.engine = create_engine(f"sqlite:///{sql_file_name}",
+                query_cache_size=1200,
+                connect_args={"cached_statements": 512})
 
         @event.listens_for(self.engine, "connect")
-        def setup_lower(dbapi_connection, conn_rec):
-            dbapi_connection.create_function("pylower", 1, str.lower)
+        def setup_connection(dbapi_connection, conn_rec):
+            # SQLite's LOWER only handles ASCII, so use str.lower, but mark
+            # it as deterministic so SQLite can reuse its results.
+            try:
+                dbapi_connection.create_function("pylower", 1, str.lower,
+                        deterministic=True)
+            except (TypeError, sqlite3.NotSupportedError):
+                dbapi_connection.create_function("pylower", 1, str.lower)
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                if value is not None:
+                    cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
 
         self.connection = self.engine.connect()
         self.metadata = MetaData()
         self.tables = {}
+        self.sql_columns = {}
+        self.column_names = {}
+        self.resolved_columns = {}
+        self.inserts = {}
+        self.insert_plans = {}
+        self.statements = OrderedDict()
+        self.selects = OrderedDict()
+        self.raw_selects = {}
 
     def close(self):
         """Close the database."""
+        if self.connection is None:
+            return
+
+        self.connection.close()
+        self.engine.dispose()
+        self.connection = None
+
+        # Transactions left open are lost with the connection.
+        self.transaction = None
+        self.bulk_transaction = None
+        self.savepoints.clear()
+
+        # Cached statements refer to tables of this connection.
+        self.statements.clear()
+        self.selects.clear()
+        self.raw_selects.clear()
+        self.resolved_columns.clear()
 
     def destroy(self):
         """Destroy the database."""
@@ -123,6 +191,13 @@ class SQLAlchemyEngine(BaseEngine):
         if self.file_name:
             self.file_name.unlink()
 
+            # Remove the files of the write-ahead log, if any.
+            for suffix in ("-wal", "-shm"):
+                side_file = self.file_name.with_name(
+                        self.file_name.name + suffix)
+                if side_file.exists():
+                    side_file.unlink()
+
     def create_migration_table(self):
         """
         Create the migration table, if it doesn't exist.
@@ -149,7 +224,8 @@ class SQLAlchemyEngine(BaseEngine):
         for column in table.columns.values():
             if isinstance(column, OneToOneColumn):
                 sql_column = Column(column.name, None, ForeignKey(
-                        f"{column.to_model.__name__.lower()}.id"))
+                        f"{column.to_model._canonical_name}."
+                        f"{column.primary.name}"))
             else:
                 sql_type = SQL_TYPES[type(column)]
                 sql_column = Column(column.name, sql_type,
@@ -159,8 +235,37 @@ class SQLAlchemyEngine(BaseEngine):
             sql_columns.append(sql_column)
 
         # Create the table object.
-        self.tables[table.name] = Table(table.name, self.metadata,
-                *sql_columns)
+        sql_table = Table(table.name, self.metadata, *sql_columns)
+        self.tables[table.name] = sql_table
+        self.sql_columns[table.name] = {column.name: column
+                for column in sql_table.c}
+        self.column_names[table.name] = tuple(table.columns.keys())
+
+        # Prepare the statement used to insert rows in this table,
+        # along with the columns whose values are set by the database.
+        self.inserts[table.name] = sql_table.insert()
+        self.insert_plans[table.name] = tuple((column, column.set_by_database)
+                for column in table.columns.values())
+
+        # Prepare the statements to update and delete rows.
+        primary_names = tuple(column.name for column in table.columns.values()
+                if column.primary_key)
+        for column in table.columns.values():
+            if not column.primary_key:
+                self._build_update(table, primary_names, (column.name, ))
+        self._build_delete(table, primary_names)
+
+        # Prepare the raw SQL to select a row by its primary keys,
+        # if no value of this table needs to be converted.
+        if all(type(column) in RAW_TYPES for column in table.columns.values()):
+            primary_keys = [column for column in sql_table.c
+                    if column.primary_key]
+            query = select(sql_table).where(*[column == bindparam(
+                    f"_pk_{column.name}") for column in primary_keys])
+            self.raw_selects[table.name] = (
+                    tuple(column.name for column in primary_keys),
+                    str(query.compile(dialect=self.engine.dialect)),
+            )
 
     def run_after_table_creation(self):
         """When all the tables have been created."""
@@ -198,27 +303,38 @@ class SQLAlchemyEngine(BaseEngine):
             the database, effectively querying the results.
 
         Returns:
-            rows (list): The list of rows matching the specified query.
+            rows (iterable): The rows matching the specified query,
+                    as dictionaries (possibly none).
 
         """
         sql_table = self.tables[table.name]
+        names = self.column_names[table.name]
         walker = QueryWalker(self, query)
-        where = walker.walk()
-        query = select(sql_table)
 
-        for table in walker.tables:
-            if table is not sql_table:
-                query = query.select_from(sql_table.join(table))
+        # Queries of the same structure share their statement.
+        key = (table.name, walker.collect())
+        query = self._get_cached(self.selects, key)
+        if query is None:
+            where = walker.build()
+            query = select(sql_table)
 
-        query = query.where(where)
+            query = self._join_tables(query, sql_table, walker.tables)
 
+            query = query.where(where)
+            self._set_cached(self.selects, key, query,
+                    self.select_cache_size)
 
-        # Send the query.
-        rows = self.connection.execute(query).fetchall()
-        if len(rows) == 0 or len(rows) < 1:
-            return None
+        # Send the query, reading rows by batches.
+        result = self.connection.execute(query, walker.params)
+        rows = []
+        while True:
+            batch = result.fetchmany(self.fetch_size)
+            if not batch:
+                break
+
+            rows.extend([dict(zip(names, row)) for row in batch])
 
-        return [self._get_dict_of_values(table, row) for row in rows]
+        return rows
 
     def get_row(self, table: GenericTable,
             columns: Dict[BaseColumn, Any]) -> Optional[Dict[str, Any]]:
@@ -239,25 +355,37 @@ class SQLAlchemyEngine(BaseEngine):
             row (dict or None): the row columns as a dict.
 
         """
-        sql_table = self.tables[table.name]
-        query = select(sql_table)
-        where = []
-        tables = set()
-        for column, value in columns.items():
-            matching_table = self.tables[column.table.name]
-            where.append(getattr(matching_table.c, column.name) == value)
-            tables.add(matching_table)
-
-        query = query.where(*where)
-
-        # Build required joins if necessary.
-        for other_table in tables:
-            if other_table is not sql_table:
-                query = query.select_from(sql_table.join(other_table))
+        raw = self.raw_selects.get(table.name)
+        if raw is not None:
+            names, sql = raw
+            if len(columns) == len(names) and all(column.table is table
+                    and column.primary_key for column in columns):
+                return self._get_raw_row(table, names, sql, columns)
+
+        key = ("select", table.name,
+                tuple((column.table.name, column.name) for column in columns))
+        query = self._get_cached(self.statements, key)
+        if query is None:
+            sql_table = self.tables[table.name]
+            query = select(sql_table)
+            where = []
+            tables = set()
+            for i, column in enumerate(columns):
+                sql_column = self.sql_columns[column.table.name][column.name]
+                where.append(sql_column == bindparam(f"_column_{i}"))
+                tables.add(sql_column.table)
+
+            query = query.where(*where)
+            query = self._join_tables(query, sql_table, tables)
+
+            self._set_cached(self.statements, key, query,
+                    self.statement_cache_size)
 
         # Send the query.
-        rows = self.connection.execute(query).fetchall()
-        if len(rows) == 0 or len(rows) < 1:
+        params = {f"_column_{i}": value
+                for i, value in enumerate(columns.values())}
+        rows = self.connection.execute(query, params).fetchmany(2)
+        if len(rows) != 1:
             return None
 
         return self._get_dict_of_values(table, rows[0])
@@ -274,52 +402,81 @@ class SQLAlchemyEngine(BaseEngine):
                     a default value).
 
         """
-        sql_table = self.tables[table.name]
-        sql_columns = {}
-        for column, value in columns.items():
-            sql_columns[column.name] = value
+        return self.insert_rows(table, [columns])[0]
 
-        # Send the query.
-        insert = sql_table.insert().values(**sql_columns)
-        result = self.connection.execute(insert)
+    def insert_rows(self, table: GenericTable,
+            rows: Sequence[Dict[BaseColumn, Any]]) -> List[Dict[str, Any]]:
+        """
+        Insert several rows in the database.
 
-        data = {}
-        primary_keys = iter(result.inserted_primary_key)
-        for column in table.columns.values():
-            value = columns.get(column)
-            if column.set_by_database:
-                value = next(primary_keys)
+        If no column of this table is set by the database, rows are
+        sent in a single query.  Otherwise, they have to be inserted
+        one at a time to know the values set by the database, though
+        in a single transaction.
 
-            data[column.name] = value
+        Args:
+            table (GenericTable): the generic table.
+            rows (sequence): the dictionaries of columns, one per row.
+                    They should all contain the same columns.
+
+        Returns:
+            data (list): the dictionary of inserted values for each row.
+
+        """
+        if not rows:
+            return []
+
+        insert = self.inserts[table.name]
+        plan = self.insert_plans[table.name]
+        sql_rows = [{column.name: value for column, value in columns.items()}
+                for columns in rows]
+
+        # Send the query.
+        if len(sql_rows) > 1 and not any(by_database
+                for _, by_database in plan):
+            self.connection.execute(insert, sql_rows)
+            return [self._get_inserted_values(plan, columns, ())
+                    for columns in rows]
+
+        if len(sql_rows) == 1:
+            result = self.connection.execute(insert, sql_rows[0])
+            return [self._get_inserted_values(plan, rows[0],
+                    result.inserted_primary_key)]
+
+        data = []
+        with self.bulk():
+            for columns, sql_columns in zip(rows, sql_rows):
+                result = self.connection.execute(insert, sql_columns)
+                data.append(self._get_inserted_values(plan, columns,
+                        result.inserted_primary_key))
 
         return data
 
     def update_row(self, table: GenericTable, primary_keys: Dict[str, Any],
-            column: BaseColumn, value: Any):
+            columns: Dict[BaseColumn, Any]):
         """
-        If possible, update the specified row's field.
+        If possible, update the specified row's fields.
 
         Args:
             table (GenericTable): the generic table.
             primary_keys (dict): the dictionary of primary keys.
-            column (BaseColumn): the column to update.
-            value (Any): the column's new value.
+            columns (dict): the columns to update, with their new values.
 
-        This value is supposed to have been filtered and allowed by the
+        These values are supposed to have been filtered and allowed by the
         model layer.
 
         """
-        sql_table = self.tables[table.name]
-        sql_primary_keys = []
-        for primary, p_value in primary_keys.items():
-            sql_primary_keys.append(getattr(sql_table.c,
-                    primary) == p_value)
+        names = tuple(column.name for column in columns)
+        key = ("update", table.name, tuple(primary_keys), names)
+        update = self._get_cached(self.statements, key)
+        if update is None:
+            update = self._build_update(table, tuple(primary_keys), names)
 
         # Send the query.
-        sql_columns = {column.name: value}
-        update = sql_table.update().where(*sql_primary_keys).values(
-                **sql_columns)
-        self.connection.execute(update)
+        params = self._get_primary_params(primary_keys)
+        for column, value in columns.items():
+            params[f"_set_{column.name}"] = value
+        self.connection.execute(update, params)
 
     def delete_row(self, table: GenericTable, primary_keys: Dict[str, Any]):
         """
@@ -330,15 +487,76 @@ class SQLAlchemyEngine(BaseEngine):
             primary_keys (dict): the dictionary of primary keys.
 
         """
-        sql_table = self.tables[table.name]
-        sql_primary_keys = []
-        for primary, p_value in primary_keys.items():
-            sql_primary_keys.append(getattr(sql_table.c,
-                    primary) == p_value)
+        key = ("delete", table.name, tuple(primary_keys))
+        delete = self._get_cached(self.statements, key)
+        if delete is None:
+            delete = self._build_delete(table, tuple(primary_keys))
+
+        # Send the query.
+        self.connection.execute(delete,
+                self._get_primary_params(primary_keys))
+
+    def delete_rows(self, table: GenericTable,
+            primary_keys: Sequence[Dict[str, Any]]):
+        """
+        Delete several rows from the database in one query.
+
+        Args:
+            table (GenericTable): the generic table.
+            primary_keys (sequence of dict): the dictionaries of
+                    primary keys, one per row.
+
+        """
+        if not primary_keys:
+            return
+
+        key = ("delete", table.name, tuple(primary_keys[0]))
+        delete = self._get_cached(self.statements, key)
+        if delete is None:
+            delete = self._build_delete(table, key[2])
 
         # Send the query.
-        delete = sql_table.delete().where(*sql_primary_keys)
-        self.connection.execute(delete)
+        self.connection.execute(delete, [self._get_primary_params(primary)
+                for primary in primary_keys])
+
+    @contextmanager
+    def bulk(self):
+        """
+        Group the queries sent in this context in one SQL transaction.
+
+        Each query is otherwise committed on its own, which can be slow
+        when many rows are inserted, updated or deleted.  If a transaction
+        (or another bulk) is already open, queries simply join it: they
+        will be committed or rolled back with it.  Database transactions
+        opened in this context use savepoints, see `begin_transaction`.
+
+        Note:
+            Unlike `Database.transaction`, a failure in this context
+            doesn't restore model instances as they were: use
+            a database transaction if you need to.
+
+        Example:
+            ```python
+            with db.engine.bulk():
+                for name in names:
+                    User.create(name=name)
+            ```
+
+        """
+        if self.transaction is not None or self.bulk_transaction is not None:
+            yield
+            return
+
+        self.bulk_transaction = self.connection.begin()
+        try:
+            yield
+        except BaseException:
+            self.bulk_transaction.rollback()
+            raise
+        else:
+            self.bulk_transaction.commit()
+        finally:
+            self.bulk_transaction = None
 
     def begin_transaction(self, transaction: Transaction):
         """
@@ -354,13 +572,16 @@ class SQLAlchemyEngine(BaseEngine):
             a savepoint and can be rolled back.  The outer transaction,
             however, is handled by SQLAlchemy.  To handle inner
             transactions, Pygasus has to send raw SQL to SQLAlchemy.
+            An outer transaction begun inside `bulk` also uses a
+            savepoint, since a SQL transaction is already open.
 
         """
-        if transaction.parent: # This is an inner transaction.
-            t_id = next(self.savepoint_id)
-            savepoint = f"sp{t_id}"
-            self.savepoints[transaction] = t_id
-            self.connection.execute(text(f"SAVEPOINT {savepoint};"))
+        if transaction.parent or self.bulk_transaction is not None:
+            # This is an inner transaction (or inside a bulk).
+            depth = len(self.savepoints) + 1
+            self.savepoints[transaction] = depth
+            begin, _, _ = self._get_savepoint_statements(depth)
+            self.connection.execute(begin)
         else: # This is an outer transaction.
             self.transaction = self.connection.begin()
 
@@ -380,10 +601,10 @@ class SQLAlchemyEngine(BaseEngine):
             transactions, Pygasus has to send raw SQL to SQLAlchemy.
 
         """
-        if transaction.parent: # This is an inner transaction.
-            t_id = self.savepoints.pop(transaction)
-            savepoint = f"sp{t_id}"
-            self.connection.execute(text(f"RELEASE SAVEPOINT {savepoint};"))
+        depth = self.savepoints.pop(transaction, None)
+        if depth is not None: # This transaction uses a savepoint.
+            _, release, _ = self._get_savepoint_statements(depth)
+            self.connection.execute(release)
         else: # This is an outer transaction.
             self.transaction.commit()
             self.transaction.close()
@@ -405,19 +626,166 @@ class SQLAlchemyEngine(BaseEngine):
             transactions, Pygasus has to send raw SQL to SQLAlchemy.
 
         """
-        if transaction.parent: # This is an inner transaction.
-            t_id = self.savepoints.pop(transaction)
-            savepoint = f"sp{t_id}"
-            self.connection.execute(text(f"ROLLBACK TRANSACTION TO SAVEPOINT {savepoint};"))
+        depth = self.savepoints.pop(transaction, None)
+        if depth is not None: # This transaction uses a savepoint.
+            _, _, rollback = self._get_savepoint_statements(depth)
+            self.connection.execute(rollback)
         else: # This is an outer transaction.
             self.transaction.rollback()
             self.transaction = None
 
+    def _get_savepoint_statements(self, depth: int) -> tuple:
+        """
+        Return the statements to handle the savepoint at this depth.
+
+        Inner transactions are nested, so a savepoint name only has to
+        be unique among open savepoints: naming savepoints after their
+        depth allows to build their statements once.
+
+        Args:
+            depth (int): the savepoint depth, starting at 1.
+
+        Returns:
+            statements (tuple): the statements to create, release
+                    and rollback to the savepoint.
+
+        """
+        statements = self.savepoint_statements.get(depth)
+        if statements is None:
+            statements = (
+                    text(f"SAVEPOINT sp{depth};"),
+                    text(f"RELEASE SAVEPOINT sp{depth};"),
+                    text(f"ROLLBACK TRANSACTION TO SAVEPOINT sp{depth};"),
+            )
+            self.savepoint_statements[depth] = statements
+
+        return statements
+
+    def _get_raw_row(self, table: GenericTable, names: tuple, sql: str,
+            columns: Dict[BaseColumn, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get a row by its primary keys, using the DBAPI connection.
+
+        This avoids going through SQLAlchemy's statement and result
+        processing for simple lookups.  The DBAPI connection is the
+        one used by SQLAlchemy, so transactions are shared.
+
+        Args:
+            table (GenericTable): the generic table.
+            names (tuple): the primary key names, in parameter order.
+            sql (str): the prepared SQL query.
+            columns (dict): the primary key columns and their values.
+
+        Returns:
+            row (dict or None): the row columns as a dict.
+
+        """
+        values = {column.name: value for column, value in columns.items()}
+        cursor = self.connection.connection.cursor()
+        try:
+            cursor.execute(sql, tuple(values[name] for name in names))
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+
+        if row is None:
+            return None
+
+        return self._get_dict_of_values(table, row)
+
+    @staticmethod
+    def _get_inserted_values(plan: tuple, columns: Dict[BaseColumn, Any],
+            inserted: Sequence[Any]) -> Dict[str, Any]:
+        """Return the inserted values, with those set by the database."""
+        data = {}
+        primary_keys = iter(inserted)
+        for column, by_database in plan:
+            if by_database:
+                value = next(primary_keys)
+            else:
+                value = columns.get(column)
+
+            data[column.name] = value
+
+        return data
+
+    @staticmethod
+    def _join_tables(query, sql_table: Table, tables):
+        """
+        Join the other tables to a select query.
+
+        The tables are joined in a single chain, in a stable order.
+
+        Args:
+            query (Select): the select query.
+            sql_table (Table): the selected table.
+            tables (set): the tables used by the query, which can
+                    contain the selected table itself.
+
+        Returns:
+            query (Select): the query, with joins if needed.
+
+        """
+        joined = sorted((other_table for other_table in tables
+                if other_table is not sql_table),
+                key=lambda other_table: other_table.name)
+        if not joined:
+            return query
+
+        return query.select_from(reduce(lambda left, right: left.join(right),
+                joined, sql_table))
+
+    @staticmethod
+    def _get_cached(cache: OrderedDict, key: tuple):
+        """Return a cached statement, marking it as recently used."""
+        statement = cache.get(key)
+        if statement is not None:
+            cache.move_to_end(key)
+
+        return statement
+
+    @staticmethod
+    def _set_cached(cache: OrderedDict, key: tuple, statement, size: int):
+        """Cache a statement, dropping the least recently used ones."""
+        cache[key] = statement
+        if len(cache) > size:
+            cache.popitem(last=False)
+
+    def _build_update(self, table: GenericTable, primary_names: tuple,
+            names: tuple):
+        """Build, cache and return the statement to update columns."""
+        sql_table = self.tables[table.name]
+        update = sql_table.update().where(
+                *self._where_primary_keys(table, primary_names)
+        ).values({name: bindparam(f"_set_{name}") for name in names})
+        self._set_cached(self.statements,
+                ("update", table.name, primary_names, names), update,
+                self.statement_cache_size)
+        return update
+
+    def _build_delete(self, table: GenericTable, primary_names: tuple):
+        """Build, cache and return the statement to delete a row."""
+        sql_table = self.tables[table.name]
+        delete = sql_table.delete().where(
+                *self._where_primary_keys(table, primary_names))
+        self._set_cached(self.statements,
+                ("delete", table.name, primary_names), delete,
+                self.statement_cache_size)
+        return delete
+
+    def _where_primary_keys(self, table: GenericTable,
+            primary_keys: Sequence[str]) -> list:
+        """Return the clauses to filter on primary keys, with parameters."""
+        sql_columns = self.sql_columns[table.name]
+        return [sql_columns[primary] == bindparam(f"_pk_{primary}")
+                for primary in primary_keys]
+
+    @staticmethod
+    def _get_primary_params(primary_keys: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the parameters matching `_where_primary_keys`."""
+        return {f"_pk_{primary}": value
+                for primary, value in primary_keys.items()}
+
     def _get_dict_of_values(self, table: GenericTable, row: tuple) -> dict:
         """Get and return the dictionary of values for this table."""
-        columns = table.columns.keys()
-        attrs = {}
-        for column, value in zip(columns, row):
-            attrs[column] = value
-
-        return attrs
+        return dict(zip(self.column_names[table.name], row))
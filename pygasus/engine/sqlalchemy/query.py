@@ -32,6 +32,7 @@ from operator import eq
 
 from sqlalchemy import func
 from sqlalchemy import select
+from sqlalchemy.sql import bindparam
 from sqlalchemy.sql.operators import contains
 
 from pygasus.query.operation import Binary, Function, Unary
@@ -49,41 +50,119 @@ OPERATIONS = {
     Function.LOWER: func.PYLOWER,
 }
 
+# Types of operations applied to arguments.
+OPERATORS = frozenset((Binary, Function))
+
 class QueryWalker:
 
-    """Query walker, to walk through operators."""
+    """
+    Query walker, to walk through operators.
+
+    Values in the query are replaced by bound parameters.  Walking
+    a query is done in two steps: `collect` browses the query to
+    gather the values in `params` and build a `key`, describing the
+    structure of the query without its values.  Two queries with
+    the same key can use the same SQL statement with different
+    parameters, so `build`, which creates the SQL expression,
+    is only needed when no statement matches the key.
+
+    """
 
     def __init__(self, engine, query):
         self.engine = engine
         self.query = query
         self.tables = set()
+        self.params = {}
+        self.key = ()
 
     def walk(self):
-        """Walk through the query."""
-        return self.decode(self.query)
-
-    def decode(self, query):
-        """Decode and recursively convert to SQL a query."""
-        operation = getattr(query, "operation", None)
-        if operation:
-            sql_operation = OPERATIONS[operation]
-
-        args = []
-        if isinstance(operation, (Binary, Function)):
-            first = query.arguments[0]
-            args.append(self.decode(first))
-
-            for argument in query.arguments[1:]:
-                args.append(self.decode(argument))
-            return sql_operation(*args)
-        elif isinstance(operation, Unary):
-            if operation is Unary.RETRIEVE:
-                field = query.arguments[0]
-                column = field.column
-                sql_table = self.engine.tables[column.table.name]
-                self.tables.add(sql_table)
-                sql_column = getattr(sql_table.c, column.name)
-                return sql_column
-        else:
-            primary = getattr(query, "_primary_values", (query, ))[0]
-            return primary
+        """Walk through the query, returning the SQL expression."""
+        self.collect()
+        return self.build()
+
+    def collect(self):
+        """
+        Collect the query parameters and structure.
+
+        Returns:
+            key (tuple): the query structure, also stored in `key`.
+
+        """
+        key = []
+        params = {}
+        stack = [self.query]
+        while stack:
+            query = stack.pop()
+            operation = getattr(query, "operation", None)
+            if type(operation) in OPERATORS:
+                key.append((operation, len(query.arguments)))
+                stack.extend(reversed(query.arguments))
+            elif type(operation) is Unary:
+                if operation is Unary.RETRIEVE:
+                    column = query.arguments[0].column
+                    key.append((column.table.name, column.name))
+                else:
+                    key.append((operation, ))
+            else:
+                primary = getattr(query, "_primary_values", (query, ))[0]
+                if primary is None:
+                    key.append(None)
+                else:
+                    name = f"_param_{len(params)}"
+                    params[name] = primary
+                    key.append(name)
+
+        self.key = tuple(key)
+        self.params = params
+        return self.key
+
+    def build(self):
+        """
+        Convert the query to a SQL expression.
+
+        The query tree is browsed with a stack rather than recursively:
+        an operation is first met to push its arguments, then met again,
+        once its arguments have been converted, to apply it.  Values
+        are bound to parameters named in the same order as `collect`.
+
+        """
+        stack = [(self.query, False)]
+        converted = []
+        bound = 0
+        while stack:
+            query, ready = stack.pop()
+            operation = getattr(query, "operation", None)
+            if ready:
+                number = len(query.arguments)
+                args = converted[-number:]
+                del converted[-number:]
+                converted.append(OPERATIONS[operation](*args))
+            elif type(operation) in OPERATORS:
+                stack.append((query, True))
+                stack.extend((argument, False)
+                        for argument in reversed(query.arguments))
+            elif type(operation) is Unary:
+                converted.append(self.decode_unary(query, operation))
+            else:
+                primary = getattr(query, "_primary_values", (query, ))[0]
+                if primary is None: # Keep comparisons with NULL in the SQL.
+                    converted.append(None)
+                else:
+                    converted.append(bindparam(f"_param_{bound}"))
+                    bound += 1
+
+        return converted[0]
+
+    def decode_unary(self, query, operation):
+        """Convert a unary operation, like a field, to SQL."""
+        if operation is Unary.RETRIEVE:
+            field = query.arguments[0]
+            column = field.column
+            sql_column = self.engine.resolved_columns.get(column)
+            if sql_column is None:
+                sql_column = self.engine.sql_columns[column.table.name][
+                        column.name]
+                self.engine.resolved_columns[column] = sql_column
+
+            self.tables.add(sql_column.table)
+            return sql_column
@@ -60,6 +60,8 @@ class Query:
 
     """
 
+    __slots__ = ("operation", "arguments", "model", "results")
+
     _database = None
     _engine = None
     _id_mapper = None
@@ -88,22 +90,32 @@ class Query:
         if self.results is not None:
             return self.results
 
-        results = type(self)._engine.select_rows(self.model._generic, self, {})
+        cls = type(self)
+        model = self.model
+        rows = cls._engine.select_rows(model._generic, self, {})
 
         # Add or get from IDMapper.
-        id_mapper = type(self)._database.id_mapper
-        for i, data in enumerate(results):
-            primary = self.model._primary_values_from_dict(data)
-            if id_mapper:
-                instance = id_mapper.get(self.model, primary)
-                if instance is not None:
+        id_mapper = cls._database.id_mapper
+        if not id_mapper:
+            results = [model(**data) for data in rows]
+        else:
+            rows = list(rows)
+            get_primary = model._primary_values_from_dict
+            primaries = [get_primary(data) for data in rows]
+            results = id_mapper.get_many(model, primaries)
+
+            # Rows with the same primary key share their instance.
+            created = {}
+            for i, instance in enumerate(results):
+                if instance is None:
+                    primary = primaries[i]
+                    instance = created.get(primary)
+                    if instance is None:
+                        instance = model(**rows[i])
+                        created[primary] = instance
                     results[i] = instance
-                    continue
 
-            instance = self.model(**data)
-            if id_mapper:
-                id_mapper.set(self.model, primary, instance)
-            results[i] = instance
+            id_mapper.set_many(model, created.items())
 
         self.results = results
         return results
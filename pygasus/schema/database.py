@@ -28,7 +28,7 @@
 
 """Class describing a database, working with a database engine."""
 
-from typing import Any, Dict, Optional, Sequence, Type, Union
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
 
 from pygasus.engine.base import BaseEngine
 from pygasus.engine.generic.columns.base import BaseColumn
@@ -56,9 +56,13 @@ class Database:
 
     """
 
+    __slots__ = ("_engine", "_models", "_generic_tables",
+            "_current_transaction", "id_mapper")
+
     def __init__(self):
         self._engine = SQLAlchemyEngine(self)
         self._models = {}
+        self._generic_tables = {}
         self._current_transaction = None
         self.id_mapper = IDMapper(self)
         Query._database = self
@@ -106,20 +110,33 @@ class Database:
 
         """
         models = MODELS if models is None else models
+
+        # Generic tables built for another set of models can't be reused.
+        if set(models) != set(self._models.values()):
+            self._generic_tables.clear()
+
         self._models = {cls.__name__: cls for cls in models}
-        names = {cls.__name__: cls for cls in models}
+        names = dict(self._models) # `get_fields` adds names to it.
 
         # Check that all models equire no external bound models.
+        engine = self._engine
         for cls in models:
             fields = cls.get_fields(cls, names)
             cls.load_schema(fields)
             cls._database = self
-            cls._engine = self._engine
+            cls._engine = engine
+
+        # Each of the following loops needs the previous one to be
+        # complete for all models (relations read the opposite model).
 
         # Complete fields.
         for cls in models:
             cls.complete_fields(cls)
 
+        # Index fields, now that relations are complete.
+        for cls in models:
+            cls._schema.index_fields()
+
         # Generate generic tables for models.
         for model in models:
             table = GenericTable.create_from_model(model, self)
@@ -137,8 +154,9 @@ class Database:
         self._engine.create_migration_table()
 
         # Check the model schemas.
-        for cls in self._models.values():
-            saved_schema = self._engine.get_saved_schema_for(cls)
+        saved_schemas = self._engine.get_saved_schemas(
+                tuple(self._models.values()))
+        for cls, saved_schema in saved_schemas.items():
             if saved_schema is None:
                 self._engine.create_table_for(cls._generic)
             else:
@@ -176,13 +194,47 @@ class Database:
         table = model._generic
         columns = table.prepare_columns(schema.fields_with_values)
         data = self._engine.insert_row(table, columns)
+        return self._create_from_data(model, schema, data)
+
+    def create_instances(self, model: Type[Model],
+            schemas: Sequence[ModelSchema]) -> List[Model]:
+        """
+        Create several instances of a model.
+
+        The rows are sent to the database engine at once, which can
+        insert them faster than one by one.
 
+        Args:
+            model (subclass of Model): the model class.
+            schemas (sequence of ModelSchema): the full bound schemas.
+
+        Returns:
+            instances (list of Model): the model instances.
+
+        """
+        if not schemas:
+            return []
+
+        table = model._generic
+        rows = [table.prepare_columns(schema.fields_with_values)
+                for schema in schemas]
+        data = self._engine.insert_rows(table, rows)
+        return [self._create_from_data(model, schema, values)
+                for schema, values in zip(schemas, data)]
+
+    @staticmethod
+    def _get_primary_names(instance: Model) -> Dict[str, Any]:
+        """Return the dictionary of primary key names and values."""
+        return {field.name: getattr(instance, field.name)
+                for field in type(instance)._schema._primary_keys_tuple}
+
+    def _create_from_data(self, model: Type[Model], schema: ModelSchema,
+            data: Dict[str, Any]) -> Model:
+        """Create a model instance from the inserted data."""
         # Normalizes data.
-        for key, value in tuple(data.items()):
-            if key not in model._schema.fields.keys():
-                data.pop(key)
-            else:
-                schema.values[key] = value
+        names = model._schema.field_names
+        schema.values.update({key: value for key, value in data.items()
+                if key in names})
 
         instance = model(**schema.values)
         if self.id_mapper:
@@ -256,22 +308,30 @@ class Database:
             propagate (bool): If True (the default), modify
                     the instance's field in memory.
 
+        If the field already has this value, nothing is done.
+
         """
+        current = getattr(instance, field.name)
+        if current is value or (type(current) is type(value)
+                and current == value):
+            return
+
         transaction = self._current_transaction
         if transaction:
-            if instance not in transaction.objects:
-                schema = instance._schema.bind_from(instance)
-                transaction.objects[instance] = dict(schema.values)
+            transaction.save(instance)
         table = type(instance)._generic
         partial = instance._schema.bind((), {field.name: value}, full=False)
         columns = table.prepare_columns(partial.fields_with_values)
-        primary = instance._schema.primary_names
-        for column, col_value in columns.items():
-            self._engine.update_row(table, primary, column, col_value)
+        primary = self._get_primary_names(instance)
+        if columns:
+            self._engine.update_row(table, primary, columns)
         if propagate:
-            instance._has_init = False
-            setattr(instance, field.name, value)
-            instance._has_init = True
+            if field.is_relation or field.primary_key:
+                instance._has_init = False
+                setattr(instance, field.name, value)
+                instance._has_init = True
+            else: # Only the value in memory has to change.
+                field.memory[hash(instance)] = value
 
     def delete_instance(self, instance: Model):
         """
@@ -283,10 +343,40 @@ class Database:
         """
         transaction = self._current_transaction
         if transaction:
-            if instance not in transaction.objects:
-                schema = instance._schema.bind_from(instance)
-                transaction.objects[instance] = dict(schema.values)
+            transaction.save(instance)
         table = type(instance)._generic
-        primary = instance._schema.primary_names
+        primary = self._get_primary_names(instance)
         self._engine.delete_row(table, primary)
+        if self.id_mapper:
+            self.id_mapper.delete(type(instance), instance._primary_values)
         instance._has_init = False
+
+    def delete_instances(self, model: Type[Model],
+            instances: Sequence[Model]):
+        """
+        Delete several instances of a model.
+
+        The rows are sent to the database engine at once, which can
+        delete them faster than one by one.
+
+        Args:
+            model (subclass of Model): the model class.
+            instances (sequence of Model): the model instances to delete.
+
+        """
+        if not instances:
+            return
+
+        transaction = self._current_transaction
+        if transaction:
+            for instance in instances:
+                transaction.save(instance)
+        table = model._generic
+        primary_keys = [self._get_primary_names(instance)
+                for instance in instances]
+        self._engine.delete_rows(table, primary_keys)
+        if self.id_mapper:
+            self.id_mapper.delete_many(model, [instance._primary_values
+                    for instance in instances])
+        for instance in instances:
+            instance._has_init = False
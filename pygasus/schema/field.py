@@ -30,6 +30,7 @@
 
 from typing import Any
 
+from pygasus.engine.generic.columns import BlobColumn, COL_TYPES
 from pygasus.exceptions import SetByDatabase
 from pygasus.query.operation import Unary
 from pygasus.query.query import Query
@@ -40,6 +41,10 @@ class Field(Query):
 
     """A field, to represent a database column."""
 
+    __slots__ = ("field_type", "primary_key", "name", "default",
+            "store_sequence", "mirror", "memory", "column", "column_type",
+            "is_relation", "_accepted_type")
+
     def __init__(self, field_type, primary_key=False,
             name=None, default=_NOT_SET):
         super().__init__(Unary.RETRIEVE)
@@ -52,6 +57,14 @@ class Field(Query):
         self.mirror = None
         self.memory = {}
         self.column = None
+        self.column_type = COL_TYPES.get(field_type, BlobColumn)
+        self.is_relation = False
+
+        # Values of other types are all accepted, see `accept`.
+        if field_type in (int, float, str, bytes):
+            self._accepted_type = field_type
+        else:
+            self._accepted_type = object
 
     def __hash__(self):
         return hash(self.name)
@@ -112,17 +125,15 @@ class Field(Query):
 
     def accept(self, value: Any) -> bool:
         """Return whether this value is accepted."""
-        accepted = self.field_type
-        if accepted in (int, float, str, bytes):
-            return isinstance(value, accepted)
-
-        return True
+        return isinstance(value, self._accepted_type)
 
 
 class HasOne(Field):
 
     """Wrapper around a field, linked to one."""
 
+    __slots__ = ("field", )
+
     def __init__(self, field):
         super().__init__(field.field_type, primary_key=field.primary_key,
                 name=field.name, default=field.default)
@@ -131,6 +142,7 @@ class HasOne(Field):
         self.store_sequence = False
         self.mirror = field.mirror
         self.memory = {}
+        self.is_relation = True
 
     def __get__(self, instance, owner=None):
         if instance is None:
@@ -50,6 +50,23 @@ class IDMapper:
         """
         return self.objects.get(model, {}).get(primary)
 
+    def get_many(self, model, primaries):
+        """
+        Get several objects from the ID mapper.
+
+        Args:
+            model (Model): the model class.
+            primaries (sequence of tuple): the primary fields of
+                    each object.
+
+        Returns:
+            instances (list): the model instances, or None for
+                    objects not in the ID mapper, in the same order.
+
+        """
+        objects = self.objects.get(model, {})
+        return list(map(objects.get, primaries))
+
     def set(self, model, primary, instance):
         """
         Set the object in the ID mapper.
@@ -69,6 +86,26 @@ class IDMapper:
             self.objects[model] = objects
         objects[primary] = instance
 
+    def set_many(self, model, instances):
+        """
+        Set several objects in the ID mapper.
+
+        Objects already in the ID mapper are kept.
+
+        Args:
+            model (Model): the model class.
+            instances (sequence): the `(primary, instance)` tuples.
+
+        """
+        objects = self.objects.get(model)
+        if objects is None:
+            objects = {}
+            self.objects[model] = objects
+
+        for primary, instance in instances:
+            if primary not in objects:
+                objects[primary] = instance
+
     def delete(self, model, primary):
         """
         Delete the specified model instance from the ID mapper.
@@ -82,7 +119,26 @@ class IDMapper:
         if objects is None:
             return
 
-        return objects.pop(primary)
+        return objects.pop(primary, None)
+
+    def delete_many(self, model, primaries):
+        """
+        Delete several objects from the ID mapper.
+
+        Objects not in the ID mapper are ignored.
+
+        Args:
+            model (Model): the model subclass.
+            primaries (sequence of tuple): the primary fields of
+                    each object.
+
+        """
+        objects = self.objects.get(model)
+        if objects is None:
+            return
+
+        for primary in primaries:
+            objects.pop(primary, None)
 
     def clear(self):
         """Clear the ID Mapper."""
@@ -42,19 +42,15 @@ class MetaModel(type):
 
     def __new__(cls, name, bases, attrs):
         cls = super().__new__(cls, name, bases, attrs)
+        cls._canonical_name = cls._alt_name or cls.__name__.lower()
         if cls.__name__ != "Model":
             MODELS.add(cls)
         return cls
 
     def _primary_values_from_dict(self, data: Dict[str, Any]) -> tuple:
         """Return a tuple of primary fields."""
-        primary = []
-        for key, field in self._schema.fields.items():
-            if field.primary_key:
-                value = data[key]
-                primary.append(value)
-
-        return tuple(primary)
+        return tuple([data[field.name]
+                for field in self._schema._primary_keys_tuple])
 
     @staticmethod
     def get_fields(model: Type["Model"],
@@ -80,6 +76,8 @@ class MetaModel(type):
             if isinstance(value, Field):
                 value.model = model
                 value.name = key
+                value.is_relation = (isinstance(value.field_type, type)
+                        and issubclass(value.field_type, Model))
                 fields[key] = value
 
         # If there is no PrimaryKey field, add one.
@@ -112,7 +110,7 @@ class MetaModel(type):
             if field.mirror:
                 continue
 
-            if issubclass(field.field_type, Model):
+            if field.is_relation:
                 # Try to find the opposite field.
                 for opposite in field.field_type._schema.fields.values():
                     if opposite.field_type is field.model:
@@ -162,6 +160,32 @@ class MetaModel(type):
         schema = self._schema.bind(args, kwargs, full=True)
         return self._database.create_instance(self, schema)
 
+    def create_many(self, rows):
+        """
+        Create and return several model instances.
+
+        Args:
+            rows (sequence of dict): the keyword arguments of each
+                    instance, as would be sent to `create`.
+
+        Returns:
+            instances (list of Model): the model instances.
+
+        """
+        schemas = [self._schema.bind((), dict(kwargs), full=True)
+                for kwargs in rows]
+        return self._database.create_instances(self, schemas)
+
+    def delete_many(self, instances):
+        """
+        Delete several model instances from the database.
+
+        Args:
+            instances (sequence of Model): the model instances to delete.
+
+        """
+        return self._database.delete_instances(self, instances)
+
     def get(self, *args, **kwargs):
         """
         Get a model instance from the database.
@@ -196,11 +220,6 @@ class MetaModel(type):
             value (Any): the new field value.
 
         """
-        transaction = instance._engine.database._current_transaction
-        if transaction:
-            if instance not in transaction.objects:
-                schema = instance._schema.bind_from(instance)
-                transaction.objects[instance] = dict(schema.values)
         return self._database.update_instance(instance, field, value)
 
 
@@ -219,6 +238,7 @@ class Model(metaclass=MetaModel):
     """
 
     _alt_name: Optional[str] = None
+    _canonical_name: str = "model"
     _database: Optional['pygasus.schema.database.Database'] = None
     _engine: Optional['pygasus.engine.base.BaseEngine'] = None
     _table = None
@@ -240,24 +260,15 @@ class Model(metaclass=MetaModel):
         self._has_init = True
 
     def __repr__(self):
-        pk = {}
-        for field in self._schema.primary_keys:
-            value = getattr(self, field.name)
-            pk[field.name] = value
-
-        pk = ", ".join([f"{key}={value!r}" for key, value in pk.items()])
+        pk = ", ".join([f"{field.name}={getattr(self, field.name)!r}"
+                for field in type(self)._schema._primary_keys_tuple])
         return f"<{type(self).__name__}({pk})>"
 
     @property
     def _primary_values(self):
         """Return a tuple of primary values for this model."""
-        primary = []
-        for key, field in type(self)._schema.fields.items():
-            if field.primary_key:
-                value = getattr(self, key)
-                primary.append(value)
-
-        return tuple(primary)
+        return tuple([getattr(self, field.name)
+                for field in type(self)._schema._primary_keys_tuple])
 
     def delete(self):
         """Remove this object from the database."""
@@ -104,6 +104,12 @@ class ModelSchema:
         self.fields = fields
         self.model = model
 
+        # Only useful for model schemas, see `index_fields`.
+        self.fields_by_type = {}
+        self.field_names = frozenset()
+        self._fields_tuple = ()
+        self._primary_keys_tuple = ()
+
         # Only useful for bound schemas.
         self.values = {}
 
@@ -143,6 +149,26 @@ class ModelSchema:
         return {field: self.values.get(field.name) for field in
                 self.fields.values() if field.primary_key}
 
+    def index_fields(self):
+        """
+        Index the schema fields.
+
+        This method should be called once the fields are complete
+        (once relations have been wrapped), so that, for instance,
+        fields pointing to a given model can be found without browsing
+        the schema.  The set of field names and the tuples of fields
+        and primary keys are also updated.
+
+        """
+        fields_by_type = {}
+        for field in self.fields.values():
+            fields_by_type.setdefault(field.field_type, []).append(field)
+
+        self.fields_by_type = fields_by_type
+        self.field_names = frozenset(self.fields)
+        self._fields_tuple = tuple(self.fields.values())
+        self._primary_keys_tuple = self.primary_keys
+
     def bind(self, args: Sequence[Any], kwargs: Dict[str, Any],
             full: bool = False) -> "ModelSchema":
         """
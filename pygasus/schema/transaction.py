@@ -40,6 +40,23 @@ class Transaction:
         self.parent = parent
         self.objects = {}
 
+    def save(self, instance):
+        """
+        Save the field values of an instance, if not already saved.
+
+        These values are restored if the transaction is rolled back.
+        Only the values are copied: the field names are those of the
+        instance's schema.
+
+        Args:
+            instance (Model): the model instance.
+
+        """
+        if instance not in self.objects:
+            fields = instance._schema.fields
+            self.objects[instance] = (fields,
+                    tuple([getattr(instance, key) for key in fields]))
+
     def __enter__(self):
         self.database._current_transaction = self
         self.engine.begin_transaction(self)
@@ -49,9 +66,9 @@ class Transaction:
         self.database._current_transaction = self.parent
         if exc_type:
             # Restore transaction objects as they were.
-            for obj, attrs in self.objects.items():
+            for obj, (fields, values) in self.objects.items():
                 obj._has_init = False
-                for key, value in attrs.items():
+                for key, value in zip(fields, values):
                     setattr(obj, key, value)
                 obj._has_init = True
             self.engine.rollback_transaction(self)
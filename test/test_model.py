@@ -28,9 +28,13 @@
 
 """Test the model API."""
 
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
 from test.base import BaseTest
 
-from pygasus import Model
+from pygasus import Field, Model
 from pygasus.exceptions import *
 
 class Book(Model):
@@ -41,11 +45,18 @@ class Book(Model):
     author: str
     year: int
 
+class Word(Model):
+
+    """A word, whose primary key isn't set by the database."""
+
+    spelling: str = Field(str, primary_key=True)
+    language: str
+
 class TestModels(BaseTest):
 
     """Test the model API."""
 
-    models = (Book, )
+    models = (Book, Word)
 
     def setUp(self):
         super().setUp()
@@ -78,6 +89,12 @@ class TestModels(BaseTest):
         self.assertIsNotNone(Book.get(id=book.id))
         self.assertIsNone(Book.get(id=book.id + 1))
 
+        # Getting a book matching several rows should return None.
+        Book.create(title="Five Weeks in a Balloon",
+                author="Jules Verne", year=1863)
+        self.assertIsNone(Book.get(author="Jules Verne"))
+        self.assertIsNotNone(Book.get(author="Jules Verne", year=1863))
+
     def test_update(self):
         """Test to update a model."""
         book = Book.create(title="A Voyage in a Balloon",
@@ -92,6 +109,34 @@ class TestModels(BaseTest):
         with self.assertRaises(SetByDatabase):
             book.id = 32
 
+    def test_update_same_value(self):
+        """Test to update a model with the value it already has."""
+        book = Book.create(title="A Voyage in a Balloon",
+                author="Jules Verne", year=1851)
+        engine = self.db.engine
+        with patch.object(engine, "update_row",
+                wraps=engine.update_row) as update_row:
+            with self.db.transaction as transaction:
+                book.year = 1851
+
+        # No query should be sent, and nothing saved to restore.
+        update_row.assert_not_called()
+        self.assertNotIn(book, transaction.objects)
+        self.assertEqual(Book.get(id=book.id).year, 1851)
+
+    def test_update_value_of_another_type(self):
+        """Test to update a model with an equal value of another type."""
+        book = Book.create(title="A Voyage in a Balloon",
+                author="Jules Verne", year=1)
+        engine = self.db.engine
+        with patch.object(engine, "update_row",
+                wraps=engine.update_row) as update_row:
+            book.year = True
+
+        # 1 == True, but the value should still be updated.
+        update_row.assert_called_once()
+        self.assertIs(book.year, True)
+
     def test_delete(self):
         """Create and delete a model."""
         book = Book.create(title="A Voyage in a Balloon",
@@ -99,3 +144,120 @@ class TestModels(BaseTest):
         self.assertIsNotNone(Book.get(id=book.id))
         book.delete()
         self.assertIsNone(Book.get(id=book.id))
+
+    def test_create_many(self):
+        """Create several instances at once."""
+        books = Book.create_many([
+                dict(title="A Voyage in a Balloon", author="Jules Verne",
+                    year=1851),
+                dict(title="Five Weeks in a Balloon", author="Jules Verne",
+                    year=1863),
+        ])
+        self.assertEqual(len(books), 2)
+        self.assertEqual(books[1].title, "Five Weeks in a Balloon")
+        self.assertEqual(books[1].year, 1863)
+
+        # Each book should have its own ID, and be in the ID mapper.
+        self.assertNotEqual(books[0].id, books[1].id)
+        for book in books:
+            self.assertIsNotNone(book.id)
+            self.assertIs(Book.get(id=book.id), book)
+
+        # Creating no instance shouldn't do anything.
+        self.assertEqual(Book.create_many([]), [])
+
+    def test_delete_many(self):
+        """Delete several models at once."""
+        books = Book.create_many([
+                dict(title="A Voyage in a Balloon", author="Jules Verne",
+                    year=1851),
+                dict(title="Five Weeks in a Balloon", author="Jules Verne",
+                    year=1863),
+                dict(title="A Christmas Carol", author="Charles Dickens",
+                    year=1843),
+        ])
+        Book.delete_many(books[:2])
+
+        # The deleted books should be gone from the table and ID mapper.
+        for book in books[:2]:
+            self.assertIsNone(Book.get(id=book.id))
+            self.assertIsNone(self.db.id_mapper.get(Book, (book.id, )))
+
+        # But the last book should still be there.
+        self.assertIs(Book.get(id=books[2].id), books[2])
+
+        # Deleting no instance shouldn't do anything.
+        Book.delete_many([])
+
+    def test_create_many_without_database_keys(self):
+        """Create several instances whose keys are not set by the database."""
+        words = Word.create_many([
+                dict(spelling="balloon", language="en"),
+                dict(spelling="ballon", language="fr"),
+        ])
+        self.assertEqual([word.spelling for word in words],
+                ["balloon", "ballon"])
+        for word in words:
+            self.assertIs(Word.get(spelling=word.spelling), word)
+
+        self.assertEqual(Word.get(spelling="ballon").language, "fr")
+
+    def test_close(self):
+        """Close the database and initialize it again."""
+        engine = self.db.engine
+        engine.begin_transaction(self.db.transaction)
+        self.db.close()
+        self.assertIsNone(engine.connection)
+        self.assertIsNone(engine.transaction)
+        self.assertEqual(engine.savepoints, {})
+
+        # The database should be usable once initialized again.
+        self.db.init(memory=True)
+        book = Book.create(title="A Voyage in a Balloon",
+                author="Jules Verne", year=1851)
+        self.assertIs(Book.get(id=book.id), book)
+
+    def test_destroy(self):
+        """Destroy a database stored in a file."""
+        self.db.close()
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "test.db"
+            self.db.init(path)
+            book = Book.create(title="A Voyage in a Balloon",
+                    author="Jules Verne", year=1851)
+            self.db.destroy()
+            self.assertIsNone(self.db.engine.connection)
+            self.assertFalse(path.exists())
+
+            # The database should be usable once initialized again.
+            self.db.init(path)
+            self.assertIsNone(Book.get(id=book.id))
+            self.db.destroy()
+
+    def test_pragmas(self):
+        """Initialize the database with SQLite pragmas."""
+        self.db.close()
+        self.db.init(memory=True, pragmas={"cache_size": -2000})
+        connection = self.db.engine.connection
+        self.assertEqual(connection.exec_driver_sql(
+                "PRAGMA cache_size").scalar(), -2000)
+
+        # A write-ahead log can be used, and is removed with the database.
+        self.db.close()
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "test.db"
+            self.db.init(path, pragmas={"journal_mode": "WAL"})
+            connection = self.db.engine.connection
+            self.assertEqual(connection.exec_driver_sql(
+                    "PRAGMA journal_mode").scalar(), "wal")
+            Book.create(title="A Voyage in a Balloon",
+                    author="Jules Verne", year=1851)
+            self.db.destroy()
+            self.assertEqual(list(Path(directory).iterdir()), [])
+
+            # By default, the journal mode is left to SQLite.
+            self.db.init(path)
+            connection = self.db.engine.connection
+            self.assertEqual(connection.exec_driver_sql(
+                    "PRAGMA journal_mode").scalar(), "delete")
+            self.db.destroy()
@@ -116,3 +116,46 @@ class TestTransactions(BaseTest):
         self.assertEqual(product.price, 3)
         product = Product.get(id=product_id)
         self.assertEqual(product.price, 3)
+
+    def test_transaction_in_bulk(self):
+        """Open transactions inside a bulk."""
+        with self.db.engine.bulk():
+            apple = Product.create(name="apple", price=2)
+
+            # A failing transaction should only cancel its own queries.
+            try:
+                with self.db.transaction:
+                    pear = Product.create(name="pear", price=2)
+                    raise InterruptedError
+            except InterruptedError:
+                pass
+
+            with self.db.transaction:
+                apple.price = 3
+
+        # The bulk should have been committed without the pear.
+        self.assertEqual(Product.get(id=apple.id).price, 3)
+        self.assertIsNone(Product.get(id=pear.id))
+        self.assertIsNone(self.db.engine.transaction)
+        self.assertIsNone(self.db.engine.bulk_transaction)
+
+    def test_bulk_in_transaction(self):
+        """Open a bulk inside a transaction."""
+        with self.db.transaction:
+            with self.db.engine.bulk():
+                apple = Product.create(name="apple", price=2)
+
+        self.assertIsNotNone(Product.get(id=apple.id))
+
+        # The bulk joins the transaction, so it is rolled back with it.
+        try:
+            with self.db.transaction:
+                with self.db.engine.bulk():
+                    pear = Product.create(name="pear", price=2)
+                raise InterruptedError
+        except InterruptedError:
+            pass
+
+        self.assertIsNone(Product.get(id=pear.id))
+        self.assertIsNone(self.db.engine.transaction)
+        self.assertIsNone(self.db.engine.bulk_transaction)